@@ -16,8 +16,10 @@ Key Functions
 - ``GetModelForEncodingName`` : Get the model associated with a specific encoding.
 - ``GetEncodingNameForModel`` : Get the encoding associated with a specific model.
 - ``GetEncoding`` : Obtain the ``tiktoken.Encoding`` based on a model or encoding name.
+- ``PrewarmEncodings`` : Load encodings ahead of their first use.
 - ``TokenizeStr`` : Tokenize a single string into token IDs.
 - ``GetNumTokenStr`` : Count the number of tokens in a string.
+- ``TokenizeStrs`` : Tokenize a list of strings into token IDs in batches.
 - ``TokenizeFile`` : Tokenize the contents of a file into token IDs.
 - ``GetNumTokenFile`` : Count the number of tokens in a file.
 - ``TokenizeFiles`` : Tokenize multiple files or a directory into token IDs.
@@ -37,7 +39,9 @@ from PyTokenCounter.core import (
     GetNumTokenStr,
     GetValidEncodings,
     GetValidModels,
+    PrewarmEncodings,
     TokenizeStr,
+    TokenizeStrs,
 )
 from PyTokenCounter.file_tokens import (
     GetNumTokenDir,
@@ -58,8 +62,10 @@ __all__ = [
     "GetModelForEncoding",
     "GetEncodingNameForModel",
     "GetEncoding",
+    "PrewarmEncodings",
     "TokenizeStr",
     "GetNumTokenStr",
+    "TokenizeStrs",
     "TokenizeFile",
     "GetNumTokenFile",
     "TokenizeFiles",
@@ -16,9 +16,11 @@ Key Functions
 - ``GetModelForEncodingName`` : Get the model associated with a specific encoding.
 - ``GetEncodingNameForModel`` : Get the encoding associated with a specific model.
 - ``GetEncoding`` : Obtain the ``tiktoken.Encoding`` based on a model or encoding name.
+- ``PrewarmEncodings`` : Load encodings ahead of their first use.
 - ``MapTokens`` : Maps tokens to their corresponding decoded strings based on a specified encoding.
 - ``TokenizeStr`` : Tokenize a single string into token IDs.
 - ``GetNumTokenStr`` : Count the number of tokens in a string.
+- ``TokenizeStrs`` : Tokenize a list of strings into token IDs in batches.
 - ``TokenizeFile`` : Tokenize the contents of a file into token IDs.
 - ``GetNumTokenFile`` : Count the number of tokens in a file.
 - ``TokenizeFiles`` : Tokenize multiple files or a directory into token IDs.
@@ -27,12 +29,20 @@ Key Functions
 - ``GetNumTokenDir`` : Count the number of tokens within a directory.
 """
 
+import os
 from collections import OrderedDict
+from functools import lru_cache
 
 import tiktoken
 
 from .progress import _InitializeTask, _tasks, _UpdateTask
 
+# Upper bound on worker threads used to tokenize files or strings concurrently.
+_MAX_WORKERS = os.cpu_count() or 1
+
+# Number of strings handed to the encoder per batch call in TokenizeStrs.
+_STR_BATCH_SIZE = 1024
+
 MODEL_MAPPINGS = {
     "gpt-4o": "o200k_base",
     "gpt-4": "cl100k_base",
@@ -164,7 +174,20 @@ VALID_ENCODINGS = [
 ]
 
 VALID_MODELS_STR = "\n".join(VALID_MODELS)
-VALID_ENCODINGS_STR = "\n".join(VALID_ENCODINGS)
+VALID_ENCODINGS_STR = "\n".join(dict.fromkeys(VALID_ENCODINGS))
+
+# Trailing parts of the validation error messages, built once at import so a
+# raise only formats the offending value.
+_VALID_MODELS_SUFFIX = f"\n\nValid models:\n{VALID_MODELS_STR}"
+_VALID_ENCODINGS_SUFFIX = f"\n\nValid encoding names:\n{VALID_ENCODINGS_STR}"
+_VALID_MODELS_AND_ENCODINGS_SUFFIX = (
+    f"Valid models:\n{VALID_MODELS_STR}\n\nValid encodings:\n{VALID_ENCODINGS_STR}"
+)
+
+# Hashed views of the lists above for membership checks; the lists keep their
+# order for display.
+_VALID_MODELS_SET = frozenset(VALID_MODELS)
+_VALID_ENCODINGS_SET = frozenset(VALID_ENCODINGS)
 
 BINARY_EXTENSIONS = {
     # Image formats
@@ -281,6 +304,12 @@ BINARY_EXTENSIONS = {
 }
 
 
+@lru_cache(maxsize=None)
+def _GetEncodingByName(encodingName: str) -> tiktoken.Encoding:
+    """Internal helper returning the memoized tiktoken.Encoding for an encoding name."""
+    return tiktoken.get_encoding(encoding_name=encodingName)
+
+
 def GetModelMappings() -> OrderedDict:
     """
     Get the mappings between models and their encodings.
@@ -330,10 +359,10 @@ def GetModelForEncodingName(encodingName: str) -> list[str] | str:
     ['gpt-3.5-turbo', 'gpt-4', 'gpt-4-turbo', 'text-embedding-3-large', 'text-embedding-3-small', 'text-embedding-ada-002']
     """
 
-    if encodingName not in VALID_ENCODINGS:
+    if encodingName not in _VALID_ENCODINGS_SET:
 
         raise ValueError(
-            f"Invalid encoding name: {encodingName}\n\nValid encoding names:\n{VALID_ENCODINGS_STR}"
+            f"Invalid encoding name: {encodingName}{_VALID_ENCODINGS_SUFFIX}"
         )
 
     else:
@@ -391,17 +420,15 @@ def GetEncodingForModel(modelName: str, quiet: bool = False) -> tiktoken.Encodin
     'cl100k_base'
     """
 
-    if modelName not in VALID_MODELS:
+    if modelName not in _VALID_MODELS_SET:
 
-        raise ValueError(
-            f"Invalid model: {modelName}\n\nValid models:\n{VALID_MODELS_STR}"
-        )
+        raise ValueError(f"Invalid model: {modelName}{_VALID_MODELS_SUFFIX}")
 
     else:
 
         encodingName = MODEL_MAPPINGS[modelName]
 
-        return tiktoken.get_encoding(encoding_name=encodingName)
+        return _GetEncodingByName(encodingName)
 
 
 def GetEncodingNameForModel(modelName: str, quiet: bool = False) -> str:
@@ -433,11 +460,9 @@ def GetEncodingNameForModel(modelName: str, quiet: bool = False) -> str:
     'cl100k_base'
     """
 
-    if modelName not in VALID_MODELS:
+    if modelName not in _VALID_MODELS_SET:
 
-        raise ValueError(
-            f"Invalid model: {modelName}\n\nValid models:\n{VALID_MODELS_STR}"
-        )
+        raise ValueError(f"Invalid model: {modelName}{_VALID_MODELS_SUFFIX}")
 
     else:
 
@@ -464,6 +489,63 @@ def GetValidEncodings() -> list[str]:
     return unique
 
 
+def PrewarmEncodings(encodingNames: list[str] | None = None) -> None:
+    """
+    Load tiktoken encodings ahead of their first use.
+
+    tiktoken builds an encoding's merge tables the first time it is requested, which
+    can take a noticeable amount of time (and a download if the files are not cached).
+    Calling this once at startup moves that cost out of latency-sensitive paths.
+    Encodings that are already loaded are skipped.
+
+    Parameters
+    ----------
+    encodingNames : list of str or None, optional
+        The encodings to load. If None (default), every valid encoding is loaded.
+
+    Raises
+    ------
+    TypeError
+        If "encodingNames" is not a list of str.
+    ValueError
+        If any of the given encoding names is invalid.
+
+    Examples
+    --------
+    >>> from PyTokenCounter import PrewarmEncodings
+    >>> PrewarmEncodings()
+    >>> PrewarmEncodings(["o200k_base"])
+    """
+
+    if encodingNames is None:
+
+        encodingNames = GetValidEncodings()
+
+    elif not isinstance(encodingNames, list):
+
+        raise TypeError(
+            f'Unexpected type for parameter "encodingNames". Expected type: list. Given type: {type(encodingNames)}'
+        )
+
+    for encodingName in encodingNames:
+
+        if not isinstance(encodingName, str):
+
+            raise TypeError(
+                f"Encoding names must be of type str. Found non-string value: {encodingName}"
+            )
+
+        if encodingName not in _VALID_ENCODINGS_SET:
+
+            raise ValueError(
+                f"Invalid encoding name: {encodingName}{_VALID_ENCODINGS_SUFFIX}"
+            )
+
+    for encodingName in encodingNames:
+
+        _GetEncodingByName(encodingName)
+
+
 def GetEncoding(
     model: str | None = None,
     encodingName: str | None = None,
@@ -520,50 +602,141 @@ def GetEncoding(
 
     if model is not None:
 
-        if model not in VALID_MODELS:
+        if model not in _VALID_MODELS_SET:
+
+            raise ValueError(f"Invalid model: {model}{_VALID_MODELS_SUFFIX}")
+
+        else:
+
+            _encodingName = MODEL_MAPPINGS[model]
+
+    if encodingName is not None:
+
+        if encodingName not in _VALID_ENCODINGS_SET:
 
             raise ValueError(
-                f"Invalid model: {model}\n\nValid models:\n{VALID_MODELS_STR}"
+                f"Invalid encoding name: {encodingName}{_VALID_ENCODINGS_SUFFIX}"
+            )
+
+        if model is not None and _encodingName != encodingName:
+
+            raise ValueError(
+                f'Model {model} does not have encoding name {encodingName}\n\nValid encoding names for model {model}: "{MODEL_MAPPINGS[model]}"'
             )
 
         else:
 
-            _encodingName = tiktoken.encoding_name_for_model(model_name=model)
+            _encodingName = encodingName
+
+    if _encodingName is None:
+
+        raise ValueError(
+            f"Either model or encoding must be provided. {_VALID_MODELS_AND_ENCODINGS_SUFFIX}"
+        )
+
+    return _GetEncodingByName(_encodingName)
+
+
+def _ResolveEncoding(
+    model: str | None = None,
+    encodingName: str | None = None,
+    encoding: tiktoken.Encoding | None = None,
+) -> tiktoken.Encoding:
+    """Internal helper validating the encoding arguments and returning the encoding."""
+
+    if model is not None and not isinstance(model, str):
+
+        raise TypeError(
+            f'Unexpected type for parameter "model". Expected type: str. Given type: {type(model)}'
+        )
+
+    if encodingName is not None and not isinstance(encodingName, str):
+
+        raise TypeError(
+            f'Unexpected type for parameter "encodingName". Expected type: str. Given type: {type(encodingName)}'
+        )
+
+    if encoding is not None and not isinstance(encoding, tiktoken.Encoding):
+
+        raise TypeError(
+            f'Unexpected type for parameter "encoding". Expected type: tiktoken.Encoding. Given type: {type(encoding)}'
+        )
+
+    _encodingName = None
+
+    if model is not None:
+
+        if model not in _VALID_MODELS_SET:
+
+            raise ValueError(f"Invalid model: {model}{_VALID_MODELS_SUFFIX}")
+
+        else:
+
+            _encodingName = MODEL_MAPPINGS[model]
 
     if encodingName is not None:
 
-        if encodingName not in VALID_ENCODINGS:
+        if encodingName not in _VALID_ENCODINGS_SET:
 
             raise ValueError(
-                f"Invalid encoding name: {encodingName}\n\nValid encoding names:\n{VALID_ENCODINGS_STR}"
+                f"Invalid encoding name: {encodingName}{_VALID_ENCODINGS_SUFFIX}"
             )
 
         if model is not None and _encodingName != encodingName:
 
-            if model not in VALID_MODELS:
+            raise ValueError(
+                f'Model {model} does not have encoding name {encodingName}\n\nValid encoding names for model {model}: "{MODEL_MAPPINGS[model]}"'
+            )
+
+        else:
+
+            _encodingName = encodingName
+
+    _encoding = None
+
+    if _encodingName is not None:
+
+        _encoding = _GetEncodingByName(_encodingName)
+
+    if encoding is not None:
+
+        if _encodingName is not None and _encoding != encoding:
+
+            if encodingName is not None and model is not None:
 
                 raise ValueError(
-                    f"Invalid model: {model}\n\nValid models:\n{VALID_MODELS_STR}"
+                    f"Model {model} does not have encoding {encoding}.\n\nValid encoding name for model {model}: \n{_encodingName}\n"
                 )
 
-            else:
+            elif encodingName is not None:
+
+                raise ValueError(
+                    f'Encoding name {encodingName} does not match provided encoding "{encoding}"'
+                )
+
+            elif model is not None:
 
                 raise ValueError(
-                    f'Model {model} does not have encoding name {encodingName}\n\nValid encoding names for model {model}: "{MODEL_MAPPINGS[model]}"'
+                    f'Model {model} does not have provided encoding "{encoding}".\n\nValid encoding name for model {model}: \n{_encodingName}\n'
+                )
+
+            else:
+
+                raise RuntimeError(
+                    f'Unexpected error. Given model "{model}" and encoding name "{encodingName}" resulted in encoding "{_encoding}".\nFor unknown reasons, this encoding doesn\'t match given encoding "{encoding}".\nPlease report this error.'
                 )
 
         else:
 
-            _encodingName = encodingName
+            _encoding = encoding
 
-    if _encodingName is None:
+    if _encoding is None:
 
         raise ValueError(
-            "Either model or encoding must be provided. Valid models:\n"
-            f"{VALID_MODELS_STR}\n\nValid encodings:\n{VALID_ENCODINGS_STR}"
+            f"Either model, encoding name, or encoding must be provided. {_VALID_MODELS_AND_ENCODINGS_SUFFIX}"
         )
 
-    return tiktoken.get_encoding(encoding_name=_encodingName)
+    return _encoding
 
 
 def MapTokens(
@@ -660,108 +833,9 @@ def MapTokens(
     - Nested dictionaries are processed recursively to preserve structure.
     """
 
-    if model is not None and not isinstance(model, str):
-
-        raise TypeError(
-            f'Unexpected type for parameter "model". Expected type: str. Given type: {type(model)}'
-        )
-
-    if encodingName is not None and not isinstance(encodingName, str):
-
-        raise TypeError(
-            f'Unexpected type for parameter "encodingName". Expected type: str. Given type: {type(encodingName)}'
-        )
-
-    if encoding is not None and not isinstance(encoding, tiktoken.Encoding):
-
-        raise TypeError(
-            f'Unexpected type for parameter "encoding". Expected type: tiktoken.Encoding. Given type: {type(encoding)}'
-        )
-
-    _encodingName = None
-
-    if model is not None:
-
-        if model not in VALID_MODELS:
-
-            raise ValueError(
-                f"Invalid model: {model}\n\nValid models:\n{VALID_MODELS_STR}"
-            )
-
-        else:
-
-            _encodingName = tiktoken.encoding_name_for_model(model_name=model)
-
-    if encodingName is not None:
-
-        if encodingName not in VALID_ENCODINGS:
-
-            raise ValueError(
-                f"Invalid encoding name: {encodingName}\n\nValid encoding names:\n{VALID_ENCODINGS_STR}"
-            )
-
-        if model is not None and _encodingName != encodingName:
-
-            if model not in VALID_MODELS:
-
-                raise ValueError(
-                    f"Invalid model: {model}\n\nValid models:\n{VALID_MODELS_STR}"
-                )
-
-            else:
-
-                raise ValueError(
-                    f'Model {model} does not have encoding name {encodingName}\n\nValid encoding names for model {model}: "{MODEL_MAPPINGS[model]}"'
-                )
-
-        else:
-
-            _encodingName = encodingName
-
-    _encoding = None
-
-    if _encodingName is not None:
-
-        _encoding = tiktoken.get_encoding(encoding_name=_encodingName)
-
-    if encoding is not None:
-
-        if _encodingName is not None and _encoding != encoding:
-
-            if encodingName is not None and model is not None:
-
-                raise ValueError(
-                    f"Model {model} does not have encoding {encoding}.\n\nValid encoding name for model {model}: \n{_encodingName}\n"
-                )
-
-            elif encodingName is not None:
-
-                raise ValueError(
-                    f'Encoding name {encodingName} does not match provided encoding "{encoding}"'
-                )
-
-            elif model is not None:
-
-                raise ValueError(
-                    f'Model {model} does not have provided encoding "{encoding}".\n\nValid encoding name for model {model}: \n{_encodingName}\n'
-                )
-
-            else:
-
-                raise RuntimeError(
-                    f'Unexpected error. Given model "{model}" and encoding name "{encodingName}" resulted in encoding "{_encoding}".\nFor unknown reasons, this encoding doesn\'t match given encoding "{encoding}".\nPlease report this error.'
-                )
-
-        else:
-
-            _encoding = encoding
-
-        if _encodingName is None and _encoding is None:
-
-            raise ValueError(
-                "Either model, encoding name, or encoding must be provided. Valid models:\n"
-                f"{VALID_MODELS_STR}\n\nValid encodings:\n{VALID_ENCODINGS_STR}"
-            )
+    _encoding = _ResolveEncoding(
+        model=model, encodingName=encodingName, encoding=encoding
+    )
 
     if isinstance(tokens, list):
 
@@ -870,108 +944,9 @@ def TokenizeStr(
             f'Unexpected type for parameter "string". Expected type: str. Given type: {type(string)}'
         )
 
-    if model is not None and not isinstance(model, str):
-
-        raise TypeError(
-            f'Unexpected type for parameter "model". Expected type: str. Given type: {type(model)}'
-        )
-
-    if encodingName is not None and not isinstance(encodingName, str):
-
-        raise TypeError(
-            f'Unexpected type for parameter "encodingName". Expected type: str. Given type: {type(encodingName)}'
-        )
-
-    if encoding is not None and not isinstance(encoding, tiktoken.Encoding):
-
-        raise TypeError(
-            f'Unexpected type for parameter "encoding". Expected type: tiktoken.Encoding. Given type: {type(encoding)}'
-        )
-
-    _encodingName = None
-
-    if model is not None:
-
-        if model not in VALID_MODELS:
-
-            raise ValueError(
-                f"Invalid model: {model}\n\nValid models:\n{VALID_MODELS_STR}"
-            )
-
-        else:
-
-            _encodingName = tiktoken.encoding_name_for_model(model_name=model)
-
-    if encodingName is not None:
-
-        if encodingName not in VALID_ENCODINGS:
-
-            raise ValueError(
-                f"Invalid encoding name: {encodingName}\n\nValid encoding names:\n{VALID_ENCODINGS_STR}"
-            )
-
-        if model is not None and _encodingName != encodingName:
-
-            if model not in VALID_MODELS:
-
-                raise ValueError(
-                    f"Invalid model: {model}\n\nValid models:\n{VALID_MODELS_STR}"
-                )
-
-            else:
-
-                raise ValueError(
-                    f'Model {model} does not have encoding name {encodingName}\n\nValid encoding names for model {model}: "{MODEL_MAPPINGS[model]}"'
-                )
-
-        else:
-
-            _encodingName = encodingName
-
-    _encoding = None
-
-    if _encodingName is not None:
-
-        _encoding = tiktoken.get_encoding(encoding_name=_encodingName)
-
-    if encoding is not None:
-
-        if _encodingName is not None and _encoding != encoding:
-
-            if encodingName is not None and model is not None:
-
-                raise ValueError(
-                    f"Model {model} does not have encoding {encoding}.\n\nValid encoding name for model {model}: \n{_encodingName}\n"
-                )
-
-            elif encodingName is not None:
-
-                raise ValueError(
-                    f'Encoding name {encodingName} does not match provided encoding "{encoding}"'
-                )
-
-            elif model is not None:
-
-                raise ValueError(
-                    f'Model {model} does not have provided encoding "{encoding}".\n\nValid encoding name for model {model}: \n{_encodingName}\n'
-                )
-
-            else:
-
-                raise RuntimeError(
-                    f'Unexpected error. Given model "{model}" and encoding name "{encodingName}" resulted in encoding "{_encoding}".\nFor unknown reasons, this encoding doesn\'t match given encoding "{encoding}".\nPlease report this error.'
-                )
-
-        else:
-
-            _encoding = encoding
-
-        if _encodingName is None and _encoding is None:
-
-            raise ValueError(
-                "Either model, encoding name, or encoding must be provided. Valid models:\n"
-                f"{VALID_MODELS_STR}\n\nValid encodings:\n{VALID_ENCODINGS_STR}"
-            )
+    _encoding = _ResolveEncoding(
+        model=model, encodingName=encodingName, encoding=encoding
+    )
 
     hasBar = False
     taskName = None
@@ -1062,23 +1037,9 @@ def GetNumTokenStr(
             f'Unexpected type for parameter "string". Expected type: str. Given type: {type(string)}'
         )
 
-    if model is not None and not isinstance(model, str):
-
-        raise TypeError(
-            f'Unexpected type for parameter "model". Expected type: str. Given type: {type(model)}'
-        )
-
-    if encodingName is not None and not isinstance(encodingName, str):
-
-        raise TypeError(
-            f'Unexpected type for parameter "encodingName". Expected type: str. Given type: {type(encodingName)}'
-        )
-
-    if encoding is not None and not isinstance(encoding, tiktoken.Encoding):
-
-        raise TypeError(
-            f'Unexpected type for parameter "encoding". Expected type: tiktoken.Encoding. Given type: {type(encoding)}'
-        )
+    _encoding = _ResolveEncoding(
+        model=model, encodingName=encodingName, encoding=encoding
+    )
 
     hasBar = False
     taskName = None
@@ -1091,13 +1052,7 @@ def GetNumTokenStr(
         taskName = f'Counting Tokens in "{displayString}"'
         _InitializeTask(taskName=taskName, total=1, quiet=quiet)
 
-    tokens = TokenizeStr(
-        string=string,
-        model=model,
-        encodingName=encodingName,
-        encoding=encoding,
-        quiet=quiet,
-    )
+    numTokens = len(_encoding.encode(text=string))
 
     if hasBar:
 
@@ -1108,4 +1063,114 @@ def GetNumTokenStr(
             quiet=quiet,
         )
 
-    return len(tokens)
+    return numTokens
+
+
+def TokenizeStrs(
+    strings: list[str],
+    model: str | None = "gpt-4o",
+    encodingName: str | None = None,
+    encoding: tiktoken.Encoding | None = None,
+    quiet: bool = False,
+) -> list[list[int]]:
+    """
+    Tokenize a list of strings into lists of token IDs using the specified model or encoding.
+
+    The encoding is resolved and validated once for the whole list, and the strings
+    are handed to ``tiktoken.Encoding.encode_batch`` in batches so that the encoder
+    tokenizes them on multiple threads.
+
+    Parameters
+    ----------
+    strings : list of str
+        The strings to tokenize.
+    model : str or None, optional, default="gpt-4o"
+        The name of the model to use for encoding. If provided, the encoding
+        associated with the model will be used.
+    encodingName : str or None, optional
+        The name of the encoding to use. If provided, it must match the encoding
+        associated with the specified model.
+    encoding : tiktoken.Encoding or None, optional
+        An existing tiktoken.Encoding object to use for tokenization. If provided,
+        it must match the encoding derived from the model or encodingName.
+    quiet : bool, optional
+        If True, suppress progress updates (default is False).
+
+    Returns
+    -------
+    list of list of int
+        The token IDs of each string, in the same order as ``strings``.
+
+    Raises
+    ------
+    TypeError
+        If "strings" is not a list of str, or if the types of "model",
+        "encodingName", or "encoding" are incorrect.
+    ValueError
+        If the provided "model" or "encodingName" is invalid, or if there is a
+        mismatch between the model and encoding name, or between the provided
+        encoding and the derived encoding.
+
+    Examples
+    --------
+    >>> from PyTokenCounter import TokenizeStrs
+    >>> tokens = TokenizeStrs(
+    ...     strings=["Hail to the Victors!", "2024 National Champions"], model="gpt-4o"
+    ... )
+    >>> print(tokens)
+    [[39, 663, 316, 290, 16566, 914, 0], [1323, 19, 6743, 40544]]
+    """
+
+    if not isinstance(strings, list):
+
+        raise TypeError(
+            f'Unexpected type for parameter "strings". Expected type: list. Given type: {type(strings)}'
+        )
+
+    nonStrs = [entry for entry in strings if not isinstance(entry, str)]
+
+    if len(nonStrs) > 0:
+
+        raise TypeError(
+            f"Strings must be of type str. Found non-string values: {nonStrs}"
+        )
+
+    _encoding = _ResolveEncoding(
+        model=model, encodingName=encodingName, encoding=encoding
+    )
+
+    hasBar = False
+    taskName = None
+
+    numStrings = len(strings)
+
+    if numStrings > 0 and len(_tasks) == 0 and not quiet:
+
+        hasBar = True
+        taskName = f"Tokenizing {numStrings} Strings"
+        _InitializeTask(taskName=taskName, total=numStrings, quiet=quiet)
+
+    tokenizedStrs = []
+
+    for start in range(0, numStrings, _STR_BATCH_SIZE):
+
+        batch = strings[start : start + _STR_BATCH_SIZE]
+
+        tokenizedStrs.extend(
+            _encoding.encode_batch(batch, num_threads=min(_MAX_WORKERS, len(batch)))
+        )
+
+        if hasBar:
+
+            _UpdateTask(
+                taskName=taskName,
+                advance=len(batch),
+                description=(
+                    f"Done Tokenizing {numStrings} Strings"
+                    if len(tokenizedStrs) == numStrings
+                    else None
+                ),
+                quiet=quiet,
+            )
+
+    return tokenizedStrs
@@ -16,7 +16,6 @@ Key Functions
 
 from pathlib import Path
 
-import chardet
 from rich.console import Console
 from rich.panel import Panel
 from rich.text import Text
@@ -100,19 +99,25 @@ def ReadTextFile(filePath: Path | str) -> str:
             f'Unexpected type for parameter "filePath". Expected type: str or pathlib.Path. Given type: {type(filePath)}'
         )
 
-    file = Path(filePath).resolve()
+    # Read the file in one call; a missing file surfaces here rather than via
+    # separate exists() and stat() checks beforehand.
 
-    if not file.exists():
+    try:
 
-        raise FileNotFoundError(f"File not found: {file}")
+        rawBytes = Path(filePath).read_bytes()
 
-    fileSize = file.stat().st_size
+    except FileNotFoundError:
 
-    if fileSize == 0:
+        raise FileNotFoundError(f"File not found: {Path(filePath).resolve()}") from None
+
+    if len(rawBytes) == 0:
 
         return ""
 
-    rawBytes = file.read_bytes()
+    # chardet is the heaviest import in the package and is only needed when a
+    # file is actually read, so it is loaded on first use rather than at import.
+    import chardet
+
     detection = chardet.detect(rawBytes)
     detectedEncoding = detection.get("encoding")
     confidence = detection.get("confidence", 0)
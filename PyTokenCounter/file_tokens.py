@@ -1,11 +1,15 @@
+import os
+import stat
 from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import tiktoken
 
 from .encoding_utils import ReadTextFile, UnsupportedEncodingError
 from .progress import _InitializeTask, _UpdateTask, _tasks
-from .core import BINARY_EXTENSIONS, TokenizeStr
+from .core import _MAX_WORKERS, BINARY_EXTENSIONS, TokenizeStr
+
 
 def _CountDirFiles(
     dirPath: Path,
@@ -130,6 +134,7 @@ def _ComputeTotalTokens(structure: any) -> int:
 
         return 0
 
+
 def TokenizeFile(
     filePath: Path | str,
     model: str | None = "gpt-4o",
@@ -563,6 +568,7 @@ def TokenizeDir(
 
     tokenizedDir: OrderedDict[str, list[int] | OrderedDict] = OrderedDict()
     subDirPaths: list[Path] = []
+    filePaths: list[Path] = []
 
     for entry in dirPath.iterdir():
 
@@ -593,68 +599,97 @@ def TokenizeDir(
 
                 continue
 
-            if not quiet:
+            filePaths.append(entry)
 
-                _UpdateTask(
-                    taskName=taskName,
-                    advance=0,
-                    description=f"Tokenizing {entry.relative_to(dirPath)}",
-                    quiet=quiet,
-                )
+    if filePaths:
 
-            try:
+        # As in GetNumTokenDir, files are tokenized on a thread pool and the
+        # results are consumed in directory order.
+
+        with ThreadPoolExecutor(
+            max_workers=min(_MAX_WORKERS, len(filePaths))
+        ) as executor:
 
-                tokenizedFile = TokenizeFile(
+            futures = [
+                executor.submit(
+                    TokenizeFile,
                     filePath=entry,
                     model=model,
                     encodingName=encodingName,
                     encoding=encoding,
-                    quiet=quiet,
+                    quiet=True,
                     mapTokens=mapTokens,
                 )
+                for entry in filePaths
+            ]
 
-            except UnicodeDecodeError as e:
-
-                encoding = e.encoding or "unknown"
+            try:
 
-                if excludeBinary:
+                for entry, future in zip(filePaths, futures):
 
                     if not quiet:
 
                         _UpdateTask(
                             taskName=taskName,
-                            advance=1,
-                            description=(
-                                f"Skipping binary file {entry.relative_to(dirPath)} (encoding: {encoding})"
-                            ),
+                            advance=0,
+                            description=f"Tokenizing {entry.relative_to(dirPath)}",
                             quiet=quiet,
                         )
 
-                    continue
+                    try:
 
-                else:
+                        tokenizedFile = future.result()
 
-                    raise UnsupportedEncodingError(
-                        encoding=encoding, filePath=entry
-                    ) from e
+                    except UnicodeDecodeError as e:
 
-            if mapTokens:
+                        fileEncoding = e.encoding or "unknown"
 
-                # TokenizeFile returns an OrderedDict with the file name as key.
-                tokenizedDir.update(tokenizedFile)
+                        if excludeBinary:
 
-            else:
+                            if not quiet:
 
-                tokenizedDir[entry.name] = tokenizedFile
+                                _UpdateTask(
+                                    taskName=taskName,
+                                    advance=1,
+                                    description=(
+                                        f"Skipping binary file {entry.relative_to(dirPath)} (encoding: {fileEncoding})"
+                                    ),
+                                    quiet=quiet,
+                                )
 
-            if not quiet:
+                            continue
 
-                _UpdateTask(
-                    taskName=taskName,
-                    advance=1,
-                    description=f"Done Tokenizing {entry.relative_to(dirPath)}",
-                    quiet=quiet,
-                )
+                        else:
+
+                            raise UnsupportedEncodingError(
+                                encoding=fileEncoding, filePath=entry
+                            ) from e
+
+                    if mapTokens:
+
+                        # TokenizeFile returns an OrderedDict with the file name as key.
+                        tokenizedDir.update(tokenizedFile)
+
+                    else:
+
+                        tokenizedDir[entry.name] = tokenizedFile
+
+                    if not quiet:
+
+                        _UpdateTask(
+                            taskName=taskName,
+                            advance=1,
+                            description=f"Done Tokenizing {entry.relative_to(dirPath)}",
+                            quiet=quiet,
+                        )
+
+            except BaseException:
+
+                # Drop files that have not started so the error is not held
+                # back until the rest of the directory has been tokenized.
+                executor.shutdown(wait=False, cancel_futures=True)
+
+                raise
 
     if recursive:
 
@@ -741,6 +776,12 @@ def GetNumTokenDir(
     TypeError
         If any parameter is of an unexpected type.
 
+    Notes
+    -----
+    - Files in each directory are counted on a thread pool. tiktoken releases the
+      GIL while encoding, so threads scale with cores without the pickling cost
+      of worker processes; processes only pay off for very large files.
+
     Examples
     --------
     >>> from pathlib import Path
@@ -805,6 +846,7 @@ def GetNumTokenDir(
         runningTokenTotal = 0
 
     subDirPaths: list[Path] = []
+    filePaths: list[Path] = []
 
     for entry in dirPath.iterdir():
 
@@ -833,68 +875,98 @@ def GetNumTokenDir(
 
                 continue
 
-            if not quiet:
+            filePaths.append(entry)
 
-                _UpdateTask(
-                    taskName=taskName,
-                    advance=0,
-                    description=f"Counting Tokens in {entry.relative_to(dirPath)}",
-                    quiet=quiet,
-                )
+    if filePaths:
 
-            try:
+        # tiktoken releases the GIL while encoding, so files are counted on a
+        # thread pool. Results are consumed in directory order so the mapping
+        # and progress updates match the serial behavior.
 
-                count = GetNumTokenFile(
+        with ThreadPoolExecutor(
+            max_workers=min(_MAX_WORKERS, len(filePaths))
+        ) as executor:
+
+            futures = [
+                executor.submit(
+                    GetNumTokenFile,
                     filePath=entry,
                     model=model,
                     encodingName=encodingName,
                     encoding=encoding,
-                    quiet=quiet,
+                    quiet=True,
                     mapTokens=False,
                 )
+                for entry in filePaths
+            ]
 
-            except UnicodeDecodeError as e:
-
-                encoding = e.encoding or "unknown"
+            try:
 
-                if excludeBinary:
+                for entry, future in zip(filePaths, futures):
 
                     if not quiet:
 
                         _UpdateTask(
                             taskName=taskName,
-                            advance=1,
-                            description=(
-                                f"Skipping binary file {entry.relative_to(dirPath)} (encoding: {encoding})"
-                            ),
+                            advance=0,
+                            description=f"Counting Tokens in {entry.relative_to(dirPath)}",
                             quiet=quiet,
                         )
 
-                    continue
+                    try:
 
-                else:
+                        count = future.result()
 
-                    raise UnsupportedEncodingError(
-                        encoding=encoding, filePath=entry
-                    ) from e
+                    except UnicodeDecodeError as e:
 
-            if mapTokens:
+                        fileEncoding = e.encoding or "unknown"
 
-                tokensMapping[entry.name] = count
-                totalTokens += count
+                        if excludeBinary:
 
-            else:
+                            if not quiet:
 
-                runningTokenTotal += count
+                                _UpdateTask(
+                                    taskName=taskName,
+                                    advance=1,
+                                    description=(
+                                        f"Skipping binary file {entry.relative_to(dirPath)} (encoding: {fileEncoding})"
+                                    ),
+                                    quiet=quiet,
+                                )
 
-            if not quiet:
+                            continue
 
-                _UpdateTask(
-                    taskName=taskName,
-                    advance=1,
-                    description=f"Done Counting Tokens in {entry.relative_to(dirPath)}",
-                    quiet=quiet,
-                )
+                        else:
+
+                            raise UnsupportedEncodingError(
+                                encoding=fileEncoding, filePath=entry
+                            ) from e
+
+                    if mapTokens:
+
+                        tokensMapping[entry.name] = count
+                        totalTokens += count
+
+                    else:
+
+                        runningTokenTotal += count
+
+                    if not quiet:
+
+                        _UpdateTask(
+                            taskName=taskName,
+                            advance=1,
+                            description=f"Done Counting Tokens in {entry.relative_to(dirPath)}",
+                            quiet=quiet,
+                        )
+
+            except BaseException:
+
+                # Drop files that have not started so the error is not held
+                # back until the rest of the directory has been counted.
+                executor.shutdown(wait=False, cancel_futures=True)
+
+                raise
 
     for subDir in subDirPaths:
 
@@ -1195,7 +1267,20 @@ def TokenizeFiles(
 
         inputPath = Path(inputPath)
 
-        if inputPath.is_file():
+        # A single stat call distinguishes files from directories, instead of
+        # the two calls made by is_file() followed by is_dir(). As with those
+        # methods, paths that cannot be stat'ed (missing, symlink loops,
+        # embedded NUL bytes) fall through to the RuntimeError below.
+
+        try:
+
+            inputMode = os.stat(inputPath).st_mode
+
+        except (OSError, ValueError):
+
+            inputMode = 0
+
+        if stat.S_ISREG(inputMode):
 
             if not includeHidden and inputPath.name.startswith("."):
 
@@ -1214,7 +1299,7 @@ def TokenizeFiles(
                 mapTokens=mapTokens,
             )
 
-        elif inputPath.is_dir():
+        elif stat.S_ISDIR(inputMode):
 
             return TokenizeDir(
                 dirPath=inputPath,
@@ -1332,141 +1417,197 @@ def GetNumTokenFiles(
                 quiet=quiet,
             )
 
+        # Each entry is classified once, so the files submitted to the pool
+        # below are exactly the files the ordered walk counts.
+
+        entryKinds: list[str] = []
+
         for entry in inputPath:
 
             if not includeHidden and entry.name.startswith("."):
 
-                if not quiet:
+                entryKinds.append("hidden")
 
-                    _UpdateTask(
-                        taskName="Counting Tokens in File/Directory List",
-                        advance=1,
-                        description=f"Skipping hidden entry {entry.name}",
-                        quiet=quiet,
-                    )
+            elif entry.is_file():
 
-                continue
+                if excludeBinary and entry.suffix.lower() in BINARY_EXTENSIONS:
 
-            if entry.is_file():
+                    entryKinds.append("binary")
 
-                if excludeBinary and entry.suffix.lower() in BINARY_EXTENSIONS:
+                else:
 
-                    if not quiet:
+                    entryKinds.append("file")
 
-                        _UpdateTask(
-                            taskName="Counting Tokens in File/Directory List",
-                            advance=1,
-                            description=f"Skipping binary file {entry.name}",
-                            quiet=quiet,
-                        )
+            elif entry.is_dir():
 
-                    continue
+                entryKinds.append("dir")
 
-                if not quiet:
+            else:
 
-                    _UpdateTask(
-                        taskName="Counting Tokens in File/Directory List",
-                        advance=0,
-                        description=f"Counting tokens in file {entry.name}",
-                        quiet=quiet,
-                    )
+                entryKinds.append("other")
 
-                try:
+        # tiktoken releases the GIL while encoding, so every listed file is
+        # submitted to a thread pool up front. Results are consumed in list
+        # order so the mapping and progress updates match the serial behavior.
 
-                    # For files, always get an integer count.
-                    count = GetNumTokenFile(
-                        filePath=entry,
-                        model=model,
-                        encodingName=encodingName,
-                        encoding=encoding,
-                        quiet=quiet,
-                        mapTokens=False,
-                    )
+        with ThreadPoolExecutor(
+            max_workers=max(1, min(_MAX_WORKERS, entryKinds.count("file")))
+        ) as executor:
 
-                except UnicodeDecodeError as e:
+            fileFutures = {
+                index: executor.submit(
+                    GetNumTokenFile,
+                    filePath=entry,
+                    model=model,
+                    encodingName=encodingName,
+                    encoding=encoding,
+                    quiet=True,
+                    mapTokens=False,
+                )
+                for index, (entry, entryKind) in enumerate(zip(inputPath, entryKinds))
+                if entryKind == "file"
+            }
 
-                    encoding = e.encoding or "unknown"
+            try:
 
-                    if excludeBinary:
+                for index, (entry, entryKind) in enumerate(zip(inputPath, entryKinds)):
+
+                    if entryKind == "hidden":
 
                         if not quiet:
 
                             _UpdateTask(
                                 taskName="Counting Tokens in File/Directory List",
                                 advance=1,
-                                description=(
-                                    f"Skipping binary file {entry.name} (encoding: {encoding})"
-                                ),
+                                description=f"Skipping hidden entry {entry.name}",
                                 quiet=quiet,
                             )
 
                         continue
 
-                    else:
+                    if entryKind == "binary":
 
-                        raise UnsupportedEncodingError(
-                            encoding=encoding, filePath=entry
-                        ) from e
+                        if not quiet:
 
-                if mapTokens:
+                            _UpdateTask(
+                                taskName="Counting Tokens in File/Directory List",
+                                advance=1,
+                                description=f"Skipping binary file {entry.name}",
+                                quiet=quiet,
+                            )
 
-                    result[entry.name] = count
+                        continue
 
-                else:
+                    if entryKind == "file":
 
-                    runningTokenTotal += count
+                        if not quiet:
 
-                if not quiet:
+                            _UpdateTask(
+                                taskName="Counting Tokens in File/Directory List",
+                                advance=0,
+                                description=f"Counting tokens in file {entry.name}",
+                                quiet=quiet,
+                            )
 
-                    _UpdateTask(
-                        taskName="Counting Tokens in File/Directory List",
-                        advance=1,
-                        description=f"Done counting tokens in file {entry.name}",
-                        quiet=quiet,
-                    )
+                        try:
 
-            elif entry.is_dir():
+                            count = fileFutures[index].result()
 
-                if not quiet:
+                        except UnicodeDecodeError as e:
 
-                    _UpdateTask(
-                        taskName="Counting Tokens in File/Directory List",
-                        advance=0,
-                        description=f"Counting tokens in directory {entry.name}",
-                        quiet=quiet,
-                    )
-                subMapping = GetNumTokenDir(
-                    dirPath=entry,
-                    model=model,
-                    encodingName=encodingName,
-                    encoding=encoding,
-                    recursive=recursive,
-                    quiet=quiet,
-                    excludeBinary=excludeBinary,
-                    includeHidden=includeHidden,
-                    mapTokens=mapTokens,
-                )
+                            fileEncoding = e.encoding or "unknown"
 
-                if mapTokens:
+                            if excludeBinary:
 
-                    result[entry.name] = subMapping
+                                if not quiet:
 
-                else:
+                                    _UpdateTask(
+                                        taskName="Counting Tokens in File/Directory List",
+                                        advance=1,
+                                        description=(
+                                            f"Skipping binary file {entry.name} (encoding: {fileEncoding})"
+                                        ),
+                                        quiet=quiet,
+                                    )
 
-                    runningTokenTotal += subMapping.get("numTokens", 0)
+                                continue
 
-                if not quiet:
+                            else:
 
-                    _UpdateTask(
-                        taskName="Counting Tokens in File/Directory List",
-                        advance=1,
-                        description=f"Done counting tokens in directory {entry.name}",
-                        quiet=quiet,
-                    )
+                                raise UnsupportedEncodingError(
+                                    encoding=fileEncoding, filePath=entry
+                                ) from e
 
-            else:
+                        if mapTokens:
 
-                raise ValueError(f"Entry '{entry}' is neither a file nor a directory.")
+                            result[entry.name] = count
+
+                        else:
+
+                            runningTokenTotal += count
+
+                        if not quiet:
+
+                            _UpdateTask(
+                                taskName="Counting Tokens in File/Directory List",
+                                advance=1,
+                                description=f"Done counting tokens in file {entry.name}",
+                                quiet=quiet,
+                            )
+
+                    elif entryKind == "dir":
+
+                        if not quiet:
+
+                            _UpdateTask(
+                                taskName="Counting Tokens in File/Directory List",
+                                advance=0,
+                                description=f"Counting tokens in directory {entry.name}",
+                                quiet=quiet,
+                            )
+                        subMapping = GetNumTokenDir(
+                            dirPath=entry,
+                            model=model,
+                            encodingName=encodingName,
+                            encoding=encoding,
+                            recursive=recursive,
+                            quiet=quiet,
+                            excludeBinary=excludeBinary,
+                            includeHidden=includeHidden,
+                            mapTokens=mapTokens,
+                        )
+
+                        if mapTokens:
+
+                            result[entry.name] = subMapping
+
+                        else:
+
+                            # With mapTokens False, GetNumTokenDir returns the total.
+                            runningTokenTotal += subMapping
+
+                        if not quiet:
+
+                            _UpdateTask(
+                                taskName="Counting Tokens in File/Directory List",
+                                advance=1,
+                                description=f"Done counting tokens in directory {entry.name}",
+                                quiet=quiet,
+                            )
+
+                    else:
+
+                        raise ValueError(
+                            f"Entry '{entry}' is neither a file nor a directory."
+                        )
+
+            except BaseException:
+
+                # Drop files that have not started so the error is not held
+                # back until the rest of the list has been counted.
+                executor.shutdown(wait=False, cancel_futures=True)
+
+                raise
 
         return result if mapTokens else runningTokenTotal
 
@@ -1474,7 +1615,15 @@ def GetNumTokenFiles(
 
         inputPath = Path(inputPath)
 
-        if inputPath.is_file():
+        try:
+
+            inputMode = os.stat(inputPath).st_mode
+
+        except (OSError, ValueError):
+
+            inputMode = 0
+
+        if stat.S_ISREG(inputMode):
 
             if not includeHidden and inputPath.name.startswith("."):
 
@@ -1493,7 +1642,7 @@ def GetNumTokenFiles(
                 mapTokens=False,
             )
 
-        elif inputPath.is_dir():
+        elif stat.S_ISDIR(inputMode):
 
             dirMapping = GetNumTokenDir(
                 dirPath=inputPath,
@@ -1,34 +1,239 @@
-import inspect
+import array
+import functools
 import io
+import itertools
 import json
+import os
 import sys
+from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
 
 import PyTokenCounter as tc
 from PyTokenCounter.encoding_utils import ReadTextFile
 import tiktoken
-from PIL import Image
 from PyTokenCounter.cli import ParseFiles
 
-testInputDir = Path("./Input")
-testAnswersDir = Path("./Answers")
+# Optional accelerators: orjson for loading answers and NumPy for scanning
+# mismatches. Both are used only when both are installed.
+try:
+    import numpy as np
+    import orjson
+
+    _HAVE_FAST = True
+except ImportError:
+    np = None
+    orjson = None
+    _HAVE_FAST = False
+
+# Upper bound on mismatched positions listed in a single failure report.
+MAX_MISMATCH_REPORT = 50
+
+# Fixture directories default to the ones next to this file and can be pointed
+# elsewhere through the environment.
+testDir = Path(__file__).resolve().parent
+testInputDir = Path(os.environ.get("PYTOKENCOUNTER_TEST_INPUT", testDir / "Input"))
+testAnswersDir = Path(
+    os.environ.get("PYTOKENCOUNTER_TEST_ANSWERS", testDir / "Answers")
+)
+
+# Fixture paths are built once at import and shared by every test.
+INPUT_PATHS = {
+    name: testInputDir / name
+    for name in (
+        "TestFile1.txt",
+        "TestFile2.txt",
+        "TestFile1252.txt",
+        "TestImg.jpg",
+        "TestDirectory",
+    )
+}
+ANSWER_PATHS = {
+    name: testAnswersDir / name
+    for name in (
+        "TestFile1.json",
+        "TestFile2.json",
+        "TestDirectory.json",
+        "TestDirectoryNoRecursion.json",
+    )
+}
+
+EXPECTED_MODEL_MAPPINGS = {
+    "gpt-4o": "o200k_base",
+    "gpt-4o-mini": "o200k_base",
+    "gpt-4-turbo": "cl100k_base",
+    "gpt-4": "cl100k_base",
+    "gpt-3.5-turbo": "cl100k_base",
+    "text-embedding-ada-002": "cl100k_base",
+    "text-embedding-3-small": "cl100k_base",
+    "text-embedding-3-large": "cl100k_base",
+    "Codex models": "p50k_base",
+    "text-davinci-002": "p50k_base",
+    "text-davinci-003": "p50k_base",
+    "GPT-3 models like davinci": "r50k_base",
+}
+
+EXPECTED_MODELS = tuple(EXPECTED_MODEL_MAPPINGS)
+EXPECTED_ENCODINGS = ("o200k_base", "cl100k_base", "p50k_base", "r50k_base")
+EXPECTED_MODELS_SET = frozenset(EXPECTED_MODELS)
+EXPECTED_ENCODINGS_SET = frozenset(EXPECTED_ENCODINGS)
+
+# Encodings shared by several models map to a sorted list; a single model maps
+# to its name, mirroring GetModelForEncodingName.
+_modelsByEncoding = {
+    encodingName: sorted(
+        model
+        for model, modelEncoding in EXPECTED_MODEL_MAPPINGS.items()
+        if modelEncoding == encodingName
+    )
+    for encodingName in EXPECTED_ENCODINGS
+}
+EXPECTED_ENCODING_MODELS = {
+    encodingName: models[0] if len(models) == 1 else models
+    for encodingName, models in _modelsByEncoding.items()
+}
 
 
 def RaiseTestAssertion(message: str):
     """
     Helper function to raise AssertionError with test suite file and line number.
     """
-    currentFrame = inspect.currentframe()
-    frameInfo = inspect.getframeinfo(currentFrame.f_back)
-    fileName = Path(frameInfo.filename).resolve()
-    lineNo = frameInfo.lineno
+    # Read the caller's frame directly; inspect.getframeinfo would also load
+    # source context from disk that is never used.
+    callerFrame = sys._getframe(1)
+    fileName = callerFrame.f_code.co_filename
+    lineNo = callerFrame.f_lineno
     fullMessage = f"{fileName}:{lineNo} -\n{message}"
     raise AssertionError(fullMessage)
 
 
-def CompareTokenDicts(expected, actual, path=""):
+@functools.lru_cache(maxsize=None)
+def GetTestEncoding(model: str) -> tiktoken.Encoding:
+    """
+    Resolve the tiktoken encoding for a model once and reuse it across tests.
+    """
+    return tc.GetEncoding(model=model)
+
+
+@functools.lru_cache(maxsize=None)
+def LoadAnswer(answerPath: Path) -> dict:
+    """
+    Load and parse an answer file once, sharing the result across tests.
+
+    The returned dictionary is shared between callers and must not be mutated.
+    """
+    if _HAVE_FAST:
+        return PackAnswerTokens(orjson.loads(answerPath.read_bytes()))
+
+    with answerPath.open("r") as file:
+        return PackAnswerTokens(json.load(file))
+
+
+def PackAnswerTokens(answer: dict) -> dict:
+    """
+    Store every token list in a loaded answer as an unsigned-int array, in place.
+
+    Comparing two arrays of the same type walks raw C integers instead of boxed
+    Python ints, and the cached answers take a fraction of the memory.
+    """
+    for key, value in answer.items():
+        if key == "tokens" and isinstance(value, list):
+            answer[key] = array.array("I", value)
+        elif isinstance(value, dict):
+            PackAnswerTokens(value)
+
+    return answer
+
+
+def TokensMatch(expectedTokens: array.array, actualTokens: list) -> bool:
+    """
+    Check tokenizer output against a packed answer array.
+
+    The output is packed into the same array type so the comparison runs over
+    raw C integers. Output that cannot be packed (negative or non-int values)
+    can never equal a packed answer, so it is reported as a mismatch.
+    """
+    try:
+        return expectedTokens == array.array("I", actualTokens)
+    except (OverflowError, TypeError):
+        return False
+
+
+def AsTokenVector(tokens: Sequence[int]):
+    """
+    View a token sequence as a NumPy unsigned-int vector.
+
+    Packed answer arrays are wrapped without copying; other sequences are
+    packed first, so values that are not unsigned 32-bit ints raise TypeError
+    or OverflowError instead of being wrapped or truncated by NumPy.
+    """
+    if not isinstance(tokens, array.array):
+        tokens = array.array("I", tokens)
+
+    return np.frombuffer(tokens, dtype=np.uint32)
+
+
+def FindIncorrectTokens(
+    expectedTokens: Sequence[int], actualTokens: Sequence[int]
+) -> dict:
+    """
+    Map the index of each mismatched token to its actual and expected values.
+
+    Positions past the end of the shorter list are reported against None. Only
+    the first MAX_MISMATCH_REPORT mismatches are reported, so a badly regressed
+    file does not build and print a report entry for every token. When the
+    optional accelerators are installed and both lists hold valid token IDs,
+    the overlapping range is compared in a single vectorized pass; otherwise
+    both lists are walked once together.
+    """
+    expectedVector = actualVector = None
+
+    if _HAVE_FAST:
+        try:
+            expectedVector = AsTokenVector(expectedTokens)
+            actualVector = AsTokenVector(actualTokens)
+        except (OverflowError, TypeError):
+            expectedVector = actualVector = None
+
+    if actualVector is not None:
+        minLength = min(len(expectedTokens), len(actualTokens))
+        maxLength = max(len(expectedTokens), len(actualTokens))
+
+        mismatchMask = expectedVector[:minLength] != actualVector[:minLength]
+        mismatchIndices = itertools.chain(
+            np.flatnonzero(mismatchMask)[:MAX_MISMATCH_REPORT].tolist(),
+            range(minLength, maxLength),
+        )
+        mismatches = (
+            (
+                i,
+                expectedTokens[i] if i < len(expectedTokens) else None,
+                actualTokens[i] if i < len(actualTokens) else None,
+            )
+            for i in mismatchIndices
+        )
+    else:
+        mismatches = (
+            (i, expectedToken, actualToken)
+            for i, (expectedToken, actualToken) in enumerate(
+                itertools.zip_longest(expectedTokens, actualTokens)
+            )
+            if expectedToken != actualToken
+        )
+
+    return {
+        f"{i}": {"actual": actualToken, "expected": expectedToken}
+        for i, expectedToken, actualToken in itertools.islice(
+            mismatches, MAX_MISMATCH_REPORT
+        )
+    }
+
+
+def CompareTokenDicts(expected, actual, path: tuple = ()):
     """
-    Recursively compare two nested dictionaries containing token lists.
+    Compare two nested dictionaries containing token lists.
+
+    Subdirectories are walked with an explicit stack rather than recursion.
 
     Parameters
     ----------
@@ -39,130 +244,116 @@ def CompareTokenDicts(expected, actual, path=""):
     actual : dict
         The actual token dictionary returned by the tokenization function.
         Structure mirrors that of 'expected'.
-    path : str, optional
-        The current path in the directory structure for error reporting.
+    path : tuple of str, optional
+        Segments of the current path in the directory structure. They are joined
+        with '/' only when an error is reported.
 
     Raises
     ------
     AssertionError
         If any mismatch is found between expected and actual tokens.
     """
-    for key in expected:
-        expectedPath = f"{path}/{key}" if path else key
-        if key not in actual:
-            RaiseTestAssertion(f"Missing key '{expectedPath}' in actual tokenization.")
+    stack = [(expected, actual, path)]
 
-        expectedEntry = expected[key]
-        actualEntry = actual[key]
+    while stack:
+        expectedDir, actualDir, dirSegments = stack.pop()
 
-        if isinstance(expectedEntry, dict):
-            if "tokens" in expectedEntry:
-                # It's a file
-                expectedTokens = expectedEntry["tokens"]
-                actualTokens = actualEntry
+        if expectedDir is actualDir:
+            continue
 
-                if not isinstance(actualTokens, list):
-                    RaiseTestAssertion(
-                        f"Expected '{expectedPath}' to be a list of tokens, but got {type(actualTokens).__name__}."
-                    )
+        missingKeys = expectedDir.keys() - actualDir.keys()
 
-                if expectedTokens != actualTokens:
-                    incorrectTokens = {}
-                    min_length = min(len(expectedTokens), len(actualTokens))
-                    for i in range(min_length):
-                        if expectedTokens[i] != actualTokens[i]:
-                            incorrectTokens[f"{i}"] = {
-                                "actual": actualTokens[i],
-                                "expected": expectedTokens[i],
-                            }
-
-                    # Check for extra tokens
-                    if len(expectedTokens) != len(actualTokens):
-                        if len(expectedTokens) > len(actualTokens):
-                            for i in range(min_length, len(expectedTokens)):
-                                incorrectTokens[f"{i}"] = {
-                                    "actual": None,
-                                    "expected": expectedTokens[i],
-                                }
-                        else:
-                            for i in range(min_length, len(actualTokens)):
-                                incorrectTokens[f"{i}"] = {
-                                    "actual": actualTokens[i],
-                                    "expected": None,
-                                }
+        if missingKeys:
+            key = min(missingKeys)
+            expectedPath = "/".join((*dirSegments, key))
+            RaiseTestAssertion(f"Missing key '{expectedPath}' in actual tokenization.")
 
-                    RaiseTestAssertion(
-                        f"Tokenization mismatch for file '{expectedPath}'.\n"
-                        f"Incorrect Tokens: {json.dumps(incorrectTokens, indent=4)}"
-                    )
-            else:
-                # It's a subdirectory
-                if not isinstance(actualEntry, dict):
-                    RaiseTestAssertion(
-                        f"Expected '{expectedPath}' to be a directory, but got {type(actualEntry).__name__}."
-                    )
-                # Recurse into the subdirectory
-                CompareTokenDicts(expectedEntry, actualEntry, path=expectedPath)
-        else:
-            RaiseTestAssertion(
-                f"Unexpected structure for key '{expectedPath}' in expected data."
-            )
+        extraKeys = actualDir.keys() - expectedDir.keys()
 
-    # Check for unexpected keys in actual
-    for key in actual:
-        expectedPath = f"{path}/{key}" if path else key
-        if key not in expected:
+        if extraKeys:
+            key = min(extraKeys)
+            expectedPath = "/".join((*dirSegments, key))
             RaiseTestAssertion(
                 f"Unexpected key '{expectedPath}' found in actual tokenization."
             )
 
+        for key, expectedEntry in expectedDir.items():
+            actualEntry = actualDir[key]
+
+            if isinstance(expectedEntry, dict):
+                if "tokens" in expectedEntry:
+                    # It's a file
+                    expectedTokens = expectedEntry["tokens"]
+                    actualTokens = actualEntry
+
+                    if not isinstance(actualTokens, list):
+                        expectedPath = "/".join((*dirSegments, key))
+                        RaiseTestAssertion(
+                            f"Expected '{expectedPath}' to be a list of tokens, but got {type(actualTokens).__name__}."
+                        )
+
+                    if not TokensMatch(expectedTokens, actualTokens):
+                        incorrectTokens = FindIncorrectTokens(
+                            expectedTokens, actualTokens
+                        )
+                        expectedPath = "/".join((*dirSegments, key))
+
+                        RaiseTestAssertion(
+                            f"Tokenization mismatch for file '{expectedPath}'.\n"
+                            f"Incorrect Tokens: {json.dumps(incorrectTokens, indent=4)}"
+                        )
+                else:
+                    # It's a subdirectory
+                    if not isinstance(actualEntry, dict):
+                        expectedPath = "/".join((*dirSegments, key))
+                        RaiseTestAssertion(
+                            f"Expected '{expectedPath}' to be a directory, but got {type(actualEntry).__name__}."
+                        )
+                    # Compare the subdirectory on a later pass
+                    stack.append((expectedEntry, actualEntry, (*dirSegments, key)))
+            else:
+                expectedPath = "/".join((*dirSegments, key))
+                RaiseTestAssertion(
+                    f"Unexpected structure for key '{expectedPath}' in expected data."
+                )
 
-def TestTokenizeDirectory():
+
+def VerifyDirectoryTokenization(tokenizeFunc):
     """
-    Test tokenization of a directory with multiple files and subdirectories.
+    Tokenize the test directory with the given function and compare the result
+    against the recursive directory answer.
     """
+    dirPath = INPUT_PATHS["TestDirectory"]
+    expected = LoadAnswer(ANSWER_PATHS["TestDirectory.json"])
 
-    dirPath = Path(testInputDir, "TestDirectory")
-    answerPath = Path(testAnswersDir, "TestDirectory.json")
-
-    # Load expected results
-    with answerPath.open("r") as file:
-        expected = json.load(file)
-
-    tokenizedDir = tc.TokenizeDir(
-        dirPath=dirPath,
-        model="gpt-4o",
-        recursive=True,
+    tokenizedDir = tokenizeFunc(
+        dirPath,
+        model=None,
+        encoding=GetTestEncoding("gpt-4o"),
         quiet=True,
+        mapTokens=False,
     )
 
     if not isinstance(tokenizedDir, dict):
         RaiseTestAssertion(
-            f"Expected TokenizeDir to return a dict for directory '{dirPath}', got {type(tokenizedDir).__name__}."
+            f"Expected {tokenizeFunc.__name__} to return a dict for directory '{dirPath}', got {type(tokenizedDir).__name__}."
         )
 
     CompareTokenDicts(expected, tokenizedDir)
 
 
-def TestTokenizeFilesWithDirectory():
+def TestTokenizeDirectory():
     """
-    Test tokenization of a directory using TokenizeFiles function.
+    Test tokenization of a directory with multiple files and subdirectories.
     """
-    dirPath = Path(testInputDir, "TestDirectory")
-    answerPath = Path(testAnswersDir, "TestDirectory.json")
+    VerifyDirectoryTokenization(tc.TokenizeDir)
 
-    # Load expected results
-    with answerPath.open("r") as file:
-        expected = json.load(file)
-
-    tokenizedFiles = tc.TokenizeFiles(dirPath, model="gpt-4o", quiet=True)
-
-    if not isinstance(tokenizedFiles, dict):
-        RaiseTestAssertion(
-            f"Expected TokenizeFiles to return a dict for directory '{dirPath}', got {type(tokenizedFiles).__name__}."
-        )
 
-    CompareTokenDicts(expected, tokenizedFiles)
+def TestTokenizeFilesWithDirectory():
+    """
+    Test tokenization of a directory using TokenizeFiles function.
+    """
+    VerifyDirectoryTokenization(tc.TokenizeFiles)
 
 
 def TestTokenizeFilesMultiple():
@@ -170,22 +361,26 @@ def TestTokenizeFilesMultiple():
     Test tokenization of multiple files using TokenizeFiles function.
     """
     inputFiles = [
-        Path(testInputDir, "TestFile1.txt"),
-        Path(testInputDir, "TestImg.jpg"),
-        Path(testInputDir, "TestFile2.txt"),
+        INPUT_PATHS["TestFile1.txt"],
+        INPUT_PATHS["TestImg.jpg"],
+        INPUT_PATHS["TestFile2.txt"],
     ]
     answerFiles = [
-        Path(testAnswersDir, "TestFile1.json"),
-        Path(testAnswersDir, "TestFile2.json"),
+        ANSWER_PATHS["TestFile1.json"],
+        ANSWER_PATHS["TestFile2.json"],
     ]
 
     expectedTokenLists = {}
     for inputFile, answerFile in zip([inputFiles[0], inputFiles[2]], answerFiles):
-        with answerFile.open("r") as file:
-            answer = json.load(file)
-            expectedTokenLists[inputFile.name] = answer["tokens"]
+        expectedTokenLists[inputFile.name] = LoadAnswer(answerFile)["tokens"]
 
-    tokenizedFiles = tc.TokenizeFiles(inputFiles, model="gpt-4o", quiet=True)
+    tokenizedFiles = tc.TokenizeFiles(
+        inputFiles,
+        model=None,
+        encoding=GetTestEncoding("gpt-4o"),
+        quiet=True,
+        mapTokens=False,
+    )
 
     if not isinstance(tokenizedFiles, dict):
         RaiseTestAssertion(
@@ -205,26 +400,27 @@ def TestTokenizeFilesExitOnListErrorFalse():
     Test TokenizeFiles function with exitOnListError=False to ensure it continues on encountering errors.
     """
     inputList = [
-        Path(testInputDir, "TestFile1.txt"),
-        Path(
-            testInputDir, "TestImg.jpg"
-        ),  # Assuming this file has unsupported encoding
-        Path(testInputDir, "TestFile2.txt"),
+        INPUT_PATHS["TestFile1.txt"],
+        INPUT_PATHS["TestImg.jpg"],  # Assuming this file has unsupported encoding
+        INPUT_PATHS["TestFile2.txt"],
     ]
 
     answerFiles = [
-        Path(testAnswersDir, "TestFile1.json"),
-        Path(testAnswersDir, "TestFile2.json"),
+        ANSWER_PATHS["TestFile1.json"],
+        ANSWER_PATHS["TestFile2.json"],
     ]
 
     expectedTokenLists = {}
     for inputFile, answerFile in zip([inputList[0], inputList[2]], answerFiles):
-        with answerFile.open("r") as file:
-            answer = json.load(file)
-            expectedTokenLists[inputFile.name] = answer["tokens"]
+        expectedTokenLists[inputFile.name] = LoadAnswer(answerFile)["tokens"]
 
     tokenizedFiles = tc.TokenizeFiles(
-        inputList, model="gpt-4o", quiet=True, exitOnListError=False
+        inputList,
+        model=None,
+        encoding=GetTestEncoding("gpt-4o"),
+        quiet=True,
+        exitOnListError=False,
+        mapTokens=False,
     )
 
     if not isinstance(tokenizedFiles, dict):
@@ -244,18 +440,19 @@ def TestTokenizeDirectoryNoRecursion():
     """
     Test tokenization of a directory without recursion to ensure subdirectories are not tokenized.
     """
-    dirPath = Path(testInputDir, "TestDirectory")
-    answerPath = Path(testAnswersDir, "TestDirectoryNoRecursion.json")
+    dirPath = INPUT_PATHS["TestDirectory"]
+    answerPath = ANSWER_PATHS["TestDirectoryNoRecursion.json"]
 
     # Load expected results (only top-level files)
-    with answerPath.open("r") as file:
-        expected = json.load(file)
+    expected = LoadAnswer(answerPath)
 
     tokenizedDir = tc.TokenizeDir(
         dirPath=dirPath,
-        model="gpt-4o",
+        model=None,
+        encoding=GetTestEncoding("gpt-4o"),
         recursive=False,
         quiet=True,
+        mapTokens=False,
     )
 
     if not isinstance(tokenizedDir, dict):
@@ -266,12 +463,13 @@ def TestTokenizeDirectoryNoRecursion():
     CompareTokenDicts(expected, tokenizedDir)
 
     # Ensure subdirectories are not included
-    for entry in dirPath.iterdir():
-        if entry.is_dir():
-            if entry.name in tokenizedDir:
-                RaiseTestAssertion(
-                    f"Subdirectory '{entry.name}' should not be tokenized when recursion is disabled."
-                )
+    with os.scandir(dirPath) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name in tokenizedDir:
+                    RaiseTestAssertion(
+                        f"Subdirectory '{entry.name}' should not be tokenized when recursion is disabled."
+                    )
 
 
 def TestTokenizeFilesWithInvalidInput():
@@ -302,20 +500,18 @@ def TestTokenizeFilesListQuietFalse():
     Test TokenizeFiles function with a list of files and quiet=False to ensure progress is displayed.
     """
     inputFiles = [
-        Path(testInputDir, "TestFile1.txt"),
-        Path(testInputDir, "TestImg.jpg"),
-        Path(testInputDir, "TestFile2.txt"),
+        INPUT_PATHS["TestFile1.txt"],
+        INPUT_PATHS["TestImg.jpg"],
+        INPUT_PATHS["TestFile2.txt"],
     ]
     answerFiles = [
-        Path(testAnswersDir, "TestFile1.json"),
-        Path(testAnswersDir, "TestFile2.json"),
+        ANSWER_PATHS["TestFile1.json"],
+        ANSWER_PATHS["TestFile2.json"],
     ]
 
     expectedTokenLists = {}
     for inputFile, answerFile in zip([inputFiles[0], inputFiles[2]], answerFiles):
-        with answerFile.open("r") as file:
-            answer = json.load(file)
-            expectedTokenLists[inputFile.name] = answer["tokens"]
+        expectedTokenLists[inputFile.name] = LoadAnswer(answerFile)["tokens"]
 
     # Capture stdout to verify that progress is displayed when quiet=False
     capturedOutput = io.StringIO()
@@ -323,7 +519,13 @@ def TestTokenizeFilesListQuietFalse():
     sys.stdout = capturedOutput
 
     try:
-        tokenizedFiles = tc.TokenizeFiles(inputFiles, model="gpt-4o", quiet=False)
+        tokenizedFiles = tc.TokenizeFiles(
+            inputFiles,
+            model=None,
+            encoding=GetTestEncoding("gpt-4o"),
+            quiet=False,
+            mapTokens=False,
+        )
     finally:
         sys.stdout = sysStdout  # Restore original stdout
 
@@ -352,20 +554,7 @@ def TestGetModelMappings():
     """
     Test retrieval of model to encoding mappings.
     """
-    expectedMappings = {
-        "gpt-4o": "o200k_base",
-        "gpt-4o-mini": "o200k_base",
-        "gpt-4-turbo": "cl100k_base",
-        "gpt-4": "cl100k_base",
-        "gpt-3.5-turbo": "cl100k_base",
-        "text-embedding-ada-002": "cl100k_base",
-        "text-embedding-3-small": "cl100k_base",
-        "text-embedding-3-large": "cl100k_base",
-        "Codex models": "p50k_base",
-        "text-davinci-002": "p50k_base",
-        "text-davinci-003": "p50k_base",
-        "GPT-3 models like davinci": "r50k_base",
-    }
+    expectedMappings = EXPECTED_MODEL_MAPPINGS
 
     actualMappings = tc.GetModelMappings()
 
@@ -381,26 +570,11 @@ def TestGetValidModels():
     """
     Test retrieval of valid model names.
     """
-    expectedModels = [
-        "gpt-4o",
-        "gpt-4o-mini",
-        "gpt-4-turbo",
-        "gpt-4",
-        "gpt-3.5-turbo",
-        "text-embedding-ada-002",
-        "text-embedding-3-small",
-        "text-embedding-3-large",
-        "Codex models",
-        "text-davinci-002",
-        "text-davinci-003",
-        "GPT-3 models like davinci",
-    ]
-
-    actualModels = tc.GetValidModels()
+    actualModels = frozenset(tc.GetValidModels())
 
-    if set(actualModels) != set(expectedModels):
-        missing = set(expectedModels) - set(actualModels)
-        extra = set(actualModels) - set(expectedModels)
+    if actualModels != EXPECTED_MODELS_SET:
+        missing = EXPECTED_MODELS_SET - actualModels
+        extra = actualModels - EXPECTED_MODELS_SET
         message = "Valid models mismatch.\n"
         if missing:
             message += f"Missing Models: {missing}\n"
@@ -413,13 +587,11 @@ def TestGetValidEncodings():
     """
     Test retrieval of valid encoding names.
     """
-    expectedEncodings = ["o200k_base", "cl100k_base", "p50k_base", "r50k_base"]
+    actualEncodings = frozenset(tc.GetValidEncodings())
 
-    actualEncodings = tc.GetValidEncodings()
-
-    if set(actualEncodings) != set(expectedEncodings):
-        missing = set(expectedEncodings) - set(actualEncodings)
-        extra = set(actualEncodings) - set(expectedEncodings)
+    if actualEncodings != EXPECTED_ENCODINGS_SET:
+        missing = EXPECTED_ENCODINGS_SET - actualEncodings
+        extra = actualEncodings - EXPECTED_ENCODINGS_SET
         message = "Valid encodings mismatch.\n"
         if missing:
             message += f"Missing Encodings: {missing}\n"
@@ -432,19 +604,7 @@ def TestGetModelForEncoding():
     """
     Test retrieval of the correct model(s) for each encoding.
     """
-    encodingModelPairs = {
-        "o200k_base": ["gpt-4o", "gpt-4o-mini"],
-        "cl100k_base": [
-            "gpt-3.5-turbo",
-            "gpt-4",
-            "gpt-4-turbo",
-            "text-embedding-3-large",
-            "text-embedding-3-small",
-            "text-embedding-ada-002",
-        ],
-        "p50k_base": ["Codex models", "text-davinci-002", "text-davinci-003"],
-        "r50k_base": "GPT-3 models like davinci",
-    }
+    encodingModelPairs = EXPECTED_ENCODING_MODELS
 
     for encodingName, expectedModels in encodingModelPairs.items():
         # Assume tc.GetModelForEncoding expects an encoding object, so we mock or retrieve it
@@ -487,19 +647,7 @@ def TestGetModelForEncodingName():
     """
     Test retrieval of the correct model(s) for each encoding.
     """
-    encodingModelPairs = {
-        "o200k_base": ["gpt-4o", "gpt-4o-mini"],
-        "cl100k_base": [
-            "gpt-3.5-turbo",
-            "gpt-4",
-            "gpt-4-turbo",
-            "text-embedding-3-large",
-            "text-embedding-3-small",
-            "text-embedding-ada-002",
-        ],
-        "p50k_base": ["Codex models", "text-davinci-002", "text-davinci-003"],
-        "r50k_base": "GPT-3 models like davinci",
-    }
+    encodingModelPairs = EXPECTED_ENCODING_MODELS
 
     for encodingName, expectedModel in encodingModelPairs.items():
         actualModel = tc.GetModelForEncodingName(encodingName=encodingName)
@@ -537,19 +685,11 @@ def TestGetEncodingForModel():
     """
     Test retrieval of the correct encoding for each model.
     """
+    # Placeholder model names have no tiktoken encoding to retrieve
     modelEncodingPairs = {
-        "gpt-4o": "o200k_base",
-        "gpt-4o-mini": "o200k_base",
-        "gpt-4-turbo": "cl100k_base",
-        "gpt-4": "cl100k_base",
-        "gpt-3.5-turbo": "cl100k_base",
-        "text-embedding-ada-002": "cl100k_base",
-        "text-embedding-3-small": "cl100k_base",
-        "text-embedding-3-large": "cl100k_base",
-        # "Codex models": "p50k_base",
-        "text-davinci-002": "p50k_base",
-        "text-davinci-003": "p50k_base",
-        # "GPT-3 models like davinci": "r50k_base",
+        modelName: encodingName
+        for modelName, encodingName in EXPECTED_MODEL_MAPPINGS.items()
+        if modelName not in ("Codex models", "GPT-3 models like davinci")
     }
 
     for modelName, expectedEncoding in modelEncodingPairs.items():
@@ -566,20 +706,7 @@ def TestGetEncodingNameForModel():
     """
     Test retrieval of the correct encoding for each model.
     """
-    modelEncodingPairs = {
-        "gpt-4o": "o200k_base",
-        "gpt-4o-mini": "o200k_base",
-        "gpt-4-turbo": "cl100k_base",
-        "gpt-4": "cl100k_base",
-        "gpt-3.5-turbo": "cl100k_base",
-        "text-embedding-ada-002": "cl100k_base",
-        "text-embedding-3-small": "cl100k_base",
-        "text-embedding-3-large": "cl100k_base",
-        "Codex models": "p50k_base",
-        "text-davinci-002": "p50k_base",
-        "text-davinci-003": "p50k_base",
-        "GPT-3 models like davinci": "r50k_base",
-    }
+    modelEncodingPairs = EXPECTED_MODEL_MAPPINGS
 
     for modelName, expectedEncoding in modelEncodingPairs.items():
         actualEncoding = tc.GetEncodingNameForModel(modelName=modelName)
@@ -670,9 +797,8 @@ def TestTokenizeFileWithUnsupportedEncoding():
     """
     Test tokenization of a file with unsupported encoding.
     """
-    unsupportedFilePath = Path(
-        testInputDir, "TestImg.jpg"
-    )  # Assuming this file has unsupported encoding
+    # Assuming this file has unsupported encoding
+    unsupportedFilePath = INPUT_PATHS["TestImg.jpg"]
 
     try:
         tc.TokenizeFile(filePath=unsupportedFilePath, model="gpt-4o", quiet=True)
@@ -757,7 +883,7 @@ def TestParseFilesGlobRecursive():
 def TestReadTextFileWindows1252():
     """Ensure Windows-1252 encoded files are read correctly."""
 
-    filePath = Path(testInputDir, "TestFile1252.txt")
+    filePath = INPUT_PATHS["TestFile1252.txt"]
     expected = "Café – résumé naïve fiancé"
     result = ReadTextFile(filePath)
 
@@ -780,18 +906,21 @@ def TestStr():
 
     for string, expectedTokens in expectedStrings.items():
 
-        actualTokens = tc.TokenizeStr(string=string, model="gpt-4o", quiet=True)
+        actualTokens = tc.TokenizeStr(
+            string=string,
+            model=None,
+            encoding=GetTestEncoding("gpt-4o"),
+            quiet=True,
+            mapTokens=False,
+        )
 
-        if actualTokens != expectedTokens:
-            incorrectTokens = {}
+        if not isinstance(actualTokens, list):
+            RaiseTestAssertion(
+                f"Expected TokenizeStr to return a list of tokens for string '{string}', got {type(actualTokens).__name__}."
+            )
 
-            for i, actualToken in enumerate(actualTokens):
-                if i < len(expectedTokens):
-                    if actualToken != expectedTokens[i]:
-                        incorrectTokens[f"{i}"] = {
-                            "actual": actualToken,
-                            "expected": expectedTokens[i],
-                        }
+        if actualTokens != expectedTokens:
+            incorrectTokens = FindIncorrectTokens(expectedTokens, actualTokens)
 
             RaiseTestAssertion(
                 f"Tokenization mismatch for string '{string}'.\n"
@@ -800,7 +929,9 @@ def TestStr():
             )
 
         expectedCount = len(expectedTokens)
-        actualCount = tc.GetNumTokenStr(string=string, model="gpt-4o", quiet=True)
+        actualCount = tc.GetNumTokenStr(
+            string=string, model=None, encoding=GetTestEncoding("gpt-4o"), quiet=True
+        )
         if expectedCount != actualCount:
             RaiseTestAssertion(
                 f"Token count mismatch for string '{string}'.\n"
@@ -815,59 +946,45 @@ def TestFile(inputName, answerName):
     Test file tokenization.
     """
 
-    answerPath = Path(testAnswersDir, answerName)
-    with answerPath.open("r") as file:
-        expected = json.load(file)
+    answerPath = ANSWER_PATHS[answerName]
+    expected = LoadAnswer(answerPath)
 
     expectedLen = expected["numTokens"]
     expectedTokens = expected["tokens"]
 
-    filePath = Path(testInputDir, inputName)
-
-    actualTokens = tc.TokenizeFile(filePath=filePath, model="gpt-4o", quiet=True)
+    filePath = INPUT_PATHS[inputName]
 
-    incorrectTokens = {}
-
-    for i, actualToken in enumerate(actualTokens):
-
-        if i < len(expectedTokens):
-
-            if actualToken != expectedTokens[i]:
+    actualTokens = tc.TokenizeFile(
+        filePath=filePath,
+        model=None,
+        encoding=GetTestEncoding("gpt-4o"),
+        quiet=True,
+        mapTokens=False,
+    )
 
-                incorrectTokens[f"{i}/{len(actualTokens) - 1}"] = {
-                    "actual": actualToken,
-                    "expected": expectedTokens[i],
-                }
+    if not isinstance(actualTokens, list):
+        RaiseTestAssertion(
+            f"Expected TokenizeFile to return a list of tokens for file '{filePath}', got {type(actualTokens).__name__}."
+        )
 
-    # Check for extra tokens
-    if len(expectedTokens) != len(actualTokens):
-        min_length = min(len(expectedTokens), len(actualTokens))
-        if len(expectedTokens) > len(actualTokens):
-            for i in range(min_length, len(expectedTokens)):
-                incorrectTokens[f"{i}"] = {
-                    "actual": None,
-                    "expected": expectedTokens[i],
-                }
-        else:
-            for i in range(min_length, len(actualTokens)):
-                incorrectTokens[f"{i}"] = {
-                    "actual": actualTokens[i],
-                    "expected": None,
-                }
+    if not TokensMatch(expectedTokens, actualTokens):
 
-    if len(incorrectTokens) > 0:
+        incorrectTokens = FindIncorrectTokens(expectedTokens, actualTokens)
+        formattedTokens = json.dumps(incorrectTokens, indent=4)
 
-        print(json.dumps(incorrectTokens, indent=4))
+        print(formattedTokens)
         print()
 
         RaiseTestAssertion(
             f"Tokenization mismatch for file '{filePath}'.\n"
             f"Answer Path: '{answerPath}'\n"
-            f"Incorrect Tokens: {json.dumps(incorrectTokens, indent=4)}"
+            f"Incorrect Tokens: {formattedTokens}"
         )
 
     expectedLenCount = expectedLen
-    actualLenCount = tc.GetNumTokenFile(filePath=filePath, model="gpt-4o", quiet=True)
+    actualLenCount = tc.GetNumTokenFile(
+        filePath=filePath, model=None, encoding=GetTestEncoding("gpt-4o"), quiet=True
+    )
     if expectedLenCount != actualLenCount:
 
         RaiseTestAssertion(
@@ -904,30 +1021,74 @@ def TestFileError(imgPath):
         )
 
 
-if __name__ == "__main__":
-
-    TestStr()
+def TestFile1():
+    """
+    Test tokenization of TestFile1.txt.
+    """
     TestFile(answerName="TestFile1.json", inputName="TestFile1.txt")
+
+
+def TestFile2():
+    """
+    Test tokenization of TestFile2.txt.
+    """
     TestFile(answerName="TestFile2.json", inputName="TestFile2.txt")
-    TestFileError(imgPath=Path(testInputDir, "TestImg.jpg"))
-
-    # Additional Tests
-    TestGetModelMappings()
-    TestGetValidModels()
-    TestGetValidEncodings()
-    TestGetModelForEncodingName()
-    TestGetEncodingNameForModel()
-    TestGetEncoding()
-    TestTokenizeDirectory()
-    TestTokenizeDirectoryNoRecursion()
-    TestTokenizeFilesMultiple()
-    TestTokenizeFilesExitOnListErrorFalse()
-    TestTokenizeFilesWithDirectory()
-    TestTokenizeFilesListQuietFalse()
-    TestTokenizeFileWithUnsupportedEncoding()
-    TestTokenizeFileErrorType()
-    TestParseFilesGlob()
-    TestParseFilesGlobRecursive()
-    TestReadTextFileWindows1252()
+
+
+def TestImgFileError():
+    """
+    Test that the binary TestImg.jpg is rejected.
+    """
+    TestFileError(imgPath=INPUT_PATHS["TestImg.jpg"])
+
+
+# Every test run by the suite. Each entry is a module-level function taking no
+# arguments so it can be pickled and sent to a worker process.
+TEST_FUNCTIONS = (
+    TestStr,
+    TestFile1,
+    TestFile2,
+    TestImgFileError,
+    TestGetModelMappings,
+    TestGetValidModels,
+    TestGetValidEncodings,
+    TestGetModelForEncodingName,
+    TestGetEncodingNameForModel,
+    TestGetEncoding,
+    TestTokenizeDirectory,
+    TestTokenizeDirectoryNoRecursion,
+    TestTokenizeFilesMultiple,
+    TestTokenizeFilesExitOnListErrorFalse,
+    TestTokenizeFilesWithDirectory,
+    TestTokenizeFilesListQuietFalse,
+    TestTokenizeFileWithUnsupportedEncoding,
+    TestTokenizeFileErrorType,
+    TestParseFilesGlob,
+    TestParseFilesGlobRecursive,
+    TestReadTextFileWindows1252,
+)
+
+
+if __name__ == "__main__":
+
+    # Cache the downloaded BPE files next to the suite so later runs load them
+    # from disk, then build every encoding once before the first test runs.
+    os.environ.setdefault("TIKTOKEN_CACHE_DIR", str(testDir / ".tiktoken_cache"))
+
+    for encodingName in EXPECTED_ENCODINGS:
+        tiktoken.get_encoding(encodingName)
+
+    # The tests share no mutable state, so they run in separate processes
+    # unless --serial is passed (useful for debugging and readable tracebacks).
+    if "--serial" in sys.argv[1:]:
+        for testFunction in TEST_FUNCTIONS:
+            testFunction()
+
+    else:
+        with ProcessPoolExecutor() as executor:
+            futures = [executor.submit(testFunction) for testFunction in TEST_FUNCTIONS]
+
+            for future in as_completed(futures):
+                future.result()
 
     print("All tests passed successfully!")
@@ -3,6 +3,7 @@ from pathlib import Path
 import pytest
 import tiktoken
 import PyTokenCounter as tc
+from PyTokenCounter import core
 
 TEST_DIR = Path(__file__).resolve().parent.parent / "Tests"
 ANSWERS_DIR = TEST_DIR / "Answers"
@@ -26,6 +27,11 @@ def test_get_model_mappings():
     assert tc.GetModelMappings() == expected
 
 
+def test_model_mappings_match_tiktoken():
+    for model, encoding_name in tc.GetModelMappings().items():
+        assert tiktoken.encoding_name_for_model(model) == encoding_name
+
+
 def test_get_valid_models():
     expected = [
         "gpt-4o",
@@ -150,3 +156,21 @@ def test_get_encoding_error():
     with pytest.raises(ValueError):
         tc.GetEncoding()
 
+
+def test_prewarm_encodings(monkeypatch):
+    core._GetEncodingByName.cache_clear()
+    tc.PrewarmEncodings(["o200k_base"])
+    assert core._GetEncodingByName.cache_info().currsize == 1
+
+    def fail_get_encoding(*args, **kwargs):
+        raise AssertionError("encoding was loaded again after prewarming")
+
+    monkeypatch.setattr(tiktoken, "get_encoding", fail_get_encoding)
+    assert tc.GetEncoding(model="gpt-4o").name == "o200k_base"
+
+
+def test_prewarm_encodings_error():
+    with pytest.raises(ValueError):
+        tc.PrewarmEncodings(["not_an_encoding"])
+    with pytest.raises(TypeError):
+        tc.PrewarmEncodings("o200k_base")
@@ -1,4 +1,5 @@
 import json
+from collections import OrderedDict
 from pathlib import Path
 import io
 import sys
@@ -18,7 +19,7 @@ def load_answer(name: str):
 def test_tokenize_directory():
     expected = load_answer("TestDirectory.json")
     result = tc.TokenizeDir(
-        dirPath=INPUT_DIR / "TestDirectory",
+        dir_path=INPUT_DIR / "TestDirectory",
         model="gpt-4o",
         recursive=True,
         quiet=True,
@@ -69,7 +70,7 @@ def test_tokenize_files_exit_on_list_error_false():
 def test_tokenize_directory_no_recursion():
     expected = load_answer("TestDirectoryNoRecursion.json")
     result = tc.TokenizeDir(
-        dirPath=INPUT_DIR / "TestDirectory",
+        dir_path=INPUT_DIR / "TestDirectory",
         model="gpt-4o",
         recursive=False,
         quiet=True,
@@ -159,3 +160,142 @@ def test_tokenize_str():
         count = tc.GetNumTokenStr(string=text, model="gpt-4o", quiet=True)
         assert count == len(tokens)
 
+
+def test_get_num_token_str_counts_repeated_tokens():
+    text = "the the the the"
+    tokens = tc.TokenizeStr(string=text, model="gpt-4o", quiet=True, mapTokens=False)
+    count = tc.GetNumTokenStr(string=text, model="gpt-4o", quiet=True)
+    assert count == len(tokens)
+
+
+def test_tokenize_strs_matches_tokenize_str():
+    strings = ["Hail to the Victors!", "2024 National Champions", "Corum 4 Heisman"]
+    result = tc.TokenizeStrs(strings, model="gpt-4o", quiet=True)
+    assert result == [
+        tc.TokenizeStr(string=text, model="gpt-4o", quiet=True, mapTokens=False)
+        for text in strings
+    ]
+
+
+def test_tokenize_strs_invalid_input():
+    with pytest.raises(TypeError):
+        tc.TokenizeStrs("not a list", model="gpt-4o", quiet=True)
+    with pytest.raises(TypeError):
+        tc.TokenizeStrs(["ok", 42], model="gpt-4o", quiet=True)
+
+
+def make_mixed_dir(root: Path) -> Path:
+    (root / "a.txt").write_text("Hail to the Victors!")
+    (root / ".hidden.txt").write_text("hidden text")
+    (root / "image.png").write_bytes(b"\x89PNG\r\n\x1a\n")
+    (root / "b.txt").write_text("2024 National Champions")
+    sub = root / "sub"
+    sub.mkdir()
+    (sub / "c.txt").write_text("Corum 4 Heisman")
+    (sub / ".hidden.txt").write_text("hidden text")
+    (sub / "icon.png").write_bytes(b"\x89PNG\r\n\x1a\n")
+    deeper = sub / "deeper"
+    deeper.mkdir()
+    (deeper / "d.txt").write_text("Go Blue!")
+    return root
+
+
+def count_file(path: Path) -> int:
+    return tc.GetNumTokenFile(path, model="gpt-4o", quiet=True, mapTokens=False)
+
+
+def test_get_num_token_files_list_matches_serial(tmp_path):
+    root = make_mixed_dir(tmp_path)
+    entries = [
+        root / "a.txt",
+        root / ".hidden.txt",
+        root / "image.png",
+        root / "sub",
+        root / "b.txt",
+    ]
+
+    mapped = tc.GetNumTokenFiles(entries, model="gpt-4o", quiet=True, mapTokens=True)
+    assert list(mapped) == ["a.txt", "sub", "b.txt"]
+    assert mapped["a.txt"] == count_file(root / "a.txt")
+    assert mapped["b.txt"] == count_file(root / "b.txt")
+    assert mapped["sub"] == tc.GetNumTokenDir(
+        root / "sub", model="gpt-4o", quiet=True, mapTokens=True
+    )
+
+    total = tc.GetNumTokenFiles(entries, model="gpt-4o", quiet=True, mapTokens=False)
+    assert total == sum(
+        count_file(path)
+        for path in (
+            root / "a.txt",
+            root / "b.txt",
+            root / "sub" / "c.txt",
+            root / "sub" / "deeper" / "d.txt",
+        )
+    )
+
+
+def test_get_num_token_files_list_missing_entry(tmp_path):
+    root = make_mixed_dir(tmp_path)
+    entries = [root / "a.txt", root / "missing.txt", root / "b.txt"]
+    with pytest.raises(ValueError):
+        tc.GetNumTokenFiles(entries, model="gpt-4o", quiet=True)
+
+
+def expected_dir_names(dir_path: Path) -> list[str]:
+    entries = [
+        entry
+        for entry in dir_path.iterdir()
+        if not entry.name.startswith(".")
+        and not (entry.is_file() and entry.suffix == ".png")
+    ]
+    # Files come first, in directory order, followed by subdirectories.
+    return [entry.name for entry in entries if entry.is_file()] + [
+        entry.name for entry in entries if entry.is_dir()
+    ]
+
+
+def test_get_num_token_dir_matches_serial(tmp_path):
+    root = make_mixed_dir(tmp_path)
+
+    total = tc.GetNumTokenDir(root, model="gpt-4o", quiet=True, mapTokens=False)
+    assert total == sum(
+        count_file(path)
+        for path in (
+            root / "a.txt",
+            root / "b.txt",
+            root / "sub" / "c.txt",
+            root / "sub" / "deeper" / "d.txt",
+        )
+    )
+
+    mapped = tc.GetNumTokenDir(root, model="gpt-4o", quiet=True, mapTokens=True)
+    assert mapped["numTokens"] == total
+    assert list(mapped["tokens"]) == expected_dir_names(root)
+    assert list(mapped["tokens"]["sub"]["tokens"]) == expected_dir_names(root / "sub")
+    assert mapped["tokens"]["a.txt"] == count_file(root / "a.txt")
+
+
+def expected_tokenized_dir(dir_path: Path) -> OrderedDict:
+    expected = OrderedDict()
+    for name in expected_dir_names(dir_path):
+        path = dir_path / name
+        if path.is_dir():
+            expected[name] = expected_tokenized_dir(path)
+        else:
+            expected[name] = tc.TokenizeFile(
+                path, model="gpt-4o", quiet=True, mapTokens=False
+            )
+    return expected
+
+
+def test_tokenize_dir_matches_serial(tmp_path):
+    root = make_mixed_dir(tmp_path)
+
+    # OrderedDict equality is order-sensitive, so this also checks ordering.
+    result = tc.TokenizeDir(root, model="gpt-4o", quiet=True, mapTokens=False)
+    assert result == expected_tokenized_dir(root)
+
+    mapped = tc.TokenizeDir(root, model="gpt-4o", quiet=True, mapTokens=True)
+    assert list(mapped) == expected_dir_names(root)
+    mapped_file = tc.TokenizeFile(root / "a.txt", model="gpt-4o", quiet=True)
+    assert mapped["a.txt"] == mapped_file["a.txt"]